@@ -45,7 +45,7 @@ class BertEmbeddingHandler(Handler):
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
 
-        df = ctx.df.copy()
+        df = ctx.df
 
         exp_col = next((c for c in df.columns if "опыт" in str(c).lower()), None)
         if not exp_col:
@@ -30,13 +30,14 @@ class CleanColumnsHandler(Handler):
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
 
-        df = ctx.df.copy()
+        df = ctx.df
 
-        df.columns = [str(c).strip() for c in df.columns]
+        cols = df.columns.astype(str).str.strip()
+        df.columns = cols
 
-        drop_cols = [c for c in df.columns if c.lower().startswith("unnamed")]
+        drop_cols = cols[cols.str.lower().str.startswith("unnamed")].tolist()
         if drop_cols:
-            df = df.drop(columns=drop_cols, errors="ignore")
+            df.drop(columns=drop_cols, inplace=True, errors="ignore")
             logger.info("Dropped columns: %s", drop_cols)
 
         ctx.df = df
@@ -31,7 +31,7 @@ class EnrichFeaturesHandler(Handler):
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
 
-        df = ctx.df.copy()
+        df = ctx.df
         logger.info("Генерация обогащенных признаков (EnrichFeatures)...")
 
         if "age" in df.columns:
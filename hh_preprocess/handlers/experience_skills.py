@@ -63,7 +63,7 @@ class SkillFeaturesHandler(Handler):
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
 
-        df = ctx.df.copy()
+        df = ctx.df
 
         target_cols = [
             "Ищет работу на должность:",
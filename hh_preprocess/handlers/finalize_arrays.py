@@ -21,7 +21,7 @@ class FinalizeArraysHandler(Handler):
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
 
-        df = ctx.df.copy()
+        df = ctx.df
         if _TARGET_COL not in df.columns:
             raise ValueError(f"Target column '{_TARGET_COL}' not found")
 
@@ -1,8 +1,12 @@
 """Обработчик категоризации названия должности (mapping на укрупненные группы)."""
 
 import logging
+from functools import lru_cache
 from typing import Dict, List
 
+import ahocorasick
+import pandas as pd
+
 from ..context import PipelineContext
 from ..utils.text import safe_lower
 from .base import Handler
@@ -134,6 +138,25 @@ _KEYWORDS: Dict[str, List[str]] = {
 }
 
 
+def _build_automaton() -> ahocorasick.Automaton:
+    """Собрать автомат Ахо-Корасик по всем ключевым словам `_KEYWORDS`.
+
+    Значением каждого ключевого слова служит индекс категории в `_KEYWORDS`:
+    чем меньше индекс, тем выше приоритет категории.
+    """
+    automaton = ahocorasick.Automaton()
+    for priority, keywords in enumerate(_KEYWORDS.values()):
+        for k in keywords:
+            if k not in automaton:
+                automaton.add_word(k, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORIES: List[str] = list(_KEYWORDS)
+_AUTOMATON = _build_automaton()
+
+
 def categorize_job_title(title: object) -> str:
     """Сгруппировать название должности в укрупнённую категорию .
 
@@ -147,15 +170,24 @@ def categorize_job_title(title: object) -> str:
         Название укрупнённой категории. Если значение отсутствует или не распознано,
         возвращается «Не указано» или «Прочее».
     """
-    t = safe_lower(title)
+    return _categorize_lowered(safe_lower(title))
+
+
+@lru_cache(maxsize=None)
+def _categorize_lowered(t: str) -> str:
+    """Определить категорию по уже нормализованной строке (с кэшированием).
+
+    Категория зависит только от строки, поэтому результат кэшируется:
+    одинаковые должности после `safe_lower` классифицируются один раз
+    за время работы процесса.
+    """
     if not t:
         return _UNKNOWN
 
-    for category, keywords in _KEYWORDS.items():
-        if any(k in t for k in keywords):
-            return category
-
-    return "Прочее"
+    best = min((priority for _, priority in _AUTOMATON.iter(t)), default=None)
+    if best is None:
+        return "Прочее"
+    return _CATEGORIES[best]
 
 
 class JobCategoryHandler(Handler):
@@ -164,7 +196,7 @@ class JobCategoryHandler(Handler):
     def _handle(self, ctx: PipelineContext) -> PipelineContext:
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         desired_col = next(
             (c for c in df.columns if "ищет работу на должность" in c.lower()), None
@@ -173,28 +205,39 @@ class JobCategoryHandler(Handler):
             (c for c in df.columns if "нынешняя должност" in c.lower()), None
         )
 
-        cols_map = {
-            desired_col: "job_category",
-            current_title_col: "current_job_category",
-        }
-
-        for col_name, target_name in cols_map.items():
+        targets = [
+            (desired_col, "job_category"),
+            (current_title_col, "current_job_category"),
+        ]
+
+        # Желаемая и текущая должность часто совпадают, поэтому уникальные
+        # названия обеих колонок классифицируются одним общим словарём.
+        title_cols = [c for c, _ in targets if c is not None]
+        mapping: Dict[object, str] = {}
+        if title_cols:
+            titles = pd.unique(
+                pd.concat([df[c] for c in title_cols], ignore_index=True).dropna()
+            )
+            lowered = [safe_lower(t) for t in titles]
+            mapping = dict(zip(titles, map(_categorize_lowered, lowered)))
+
+        for col_name, target_name in targets:
             if col_name is None:
                 logger.warning(
                     f"Column for {target_name} not found; using '{_UNKNOWN}'"
                 )
                 df[target_name] = _UNKNOWN
             else:
-                df[target_name] = df[col_name].map(categorize_job_title)
+                df[target_name] = df[col_name].map(mapping).fillna(_UNKNOWN)
 
         drop_cols = [c for c in [desired_col, current_title_col] if c is not None]
-        df = df.drop(columns=drop_cols, errors="ignore")
+        df.drop(columns=drop_cols, inplace=True, errors="ignore")
 
         employer_col = next(
             (c for c in df.columns if "место работы" in c.lower()), None
         )
         if employer_col is not None:
-            df = df.drop(columns=[employer_col], errors="ignore")
+            df.drop(columns=[employer_col], inplace=True, errors="ignore")
 
         ctx.df = df
         return ctx
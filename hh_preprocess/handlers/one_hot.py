@@ -76,6 +76,11 @@ class OneHotEncodeHandler(Handler):
                 cat_cols.append(c)
 
         if cat_cols:
+            # Для Categorical get_dummies создаёт колонку на каждую категорию,
+            # в том числе ни разу не встретившуюся после фильтрации строк.
+            for c in cat_cols:
+                if isinstance(df[c].dtype, pd.CategoricalDtype):
+                    df[c] = df[c].cat.remove_unused_categories()
             df[cat_cols] = df[cat_cols].fillna("Не указано")
             df = pd.get_dummies(df, columns=cat_cols, dummy_na=False)
         return df
@@ -95,7 +100,7 @@ class OneHotEncodeHandler(Handler):
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
 
-        df = ctx.df.copy()
+        df = ctx.df
         df = self._drop_raw_columns(df)
         df = self._convert_numeric(df)
         df = self._encode_categoricals(df)
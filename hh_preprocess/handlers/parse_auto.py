@@ -2,6 +2,8 @@
 
 import logging
 
+import numpy as np
+
 from ..context import PipelineContext
 from ..utils.text import safe_lower
 from .base import Handler
@@ -32,7 +34,7 @@ class ParseAutoHandler(Handler):
         """
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         if _AUTO_COL not in df.columns:
             df["has_car"] = False
@@ -64,7 +66,11 @@ class ParseAutoHandler(Handler):
                 return True
             return False
 
-        df["has_car"] = df[_AUTO_COL].map(parse_has_car).astype(bool)
+        # np.fromiter гарантирует bool и для пустого DataFrame, где
+        # Series.map вернул бы колонку типа object.
+        df["has_car"] = np.fromiter(
+            map(parse_has_car, df[_AUTO_COL]), dtype=bool, count=len(df)
+        )
 
         ctx.df = df
         return ctx
@@ -13,18 +13,19 @@ logger = logging.getLogger(__name__)
 
 
 _GENDER_AGE_COL = "Пол, возраст"
+_AGE_RE = re.compile(r"(\d{1,3})\s*(?:лет|года|год|years|year)")
+_INT_RE = re.compile(r"(\d{1,3})")
 
 
-def _parse_gender(s: object) -> str:
+def _parse_gender(t: str) -> str:
     """Определить пол по текстовому значению.
 
     Аргументы:
-        s: Значение из колонки «Пол, возраст».
+        t: Значение из колонки «Пол, возраст» после `safe_lower`.
 
     Возвращает:
         Строковая метка пола: `"M"`, `"F"` или `"U"`.
     """
-    t = safe_lower(s)
     if "муж" in t or "male" in t:
         return "M"
     if "жен" in t or "female" in t:
@@ -32,20 +33,19 @@ def _parse_gender(s: object) -> str:
     return "U"
 
 
-def _parse_age(s: object) -> float:
+def _parse_age(t: str) -> float:
     """Извлечь возраст из текстового значения.
 
     Аргументы:
-        s: Значение из колонки «Пол, возраст».
+        t: Значение из колонки «Пол, возраст» после `safe_lower`.
 
     Возвращает:
         Возраст в годах (float) или `NaN`, если возраст не распознан
         либо выходит за допустимые границы.
     """
-    t = safe_lower(s)
-    m = re.search(r"(\d{1,3})\s*(?:лет|года|год|years|year)", t)
+    m = _AGE_RE.search(t)
     if not m:
-        m2 = re.search(r"(\d{1,3})", t)
+        m2 = _INT_RE.search(t)
         if not m2:
             return np.nan
         val = int(m2.group(1))
@@ -74,7 +74,7 @@ class ParseGenderAgeHandler(Handler):
         """
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         if _GENDER_AGE_COL not in df.columns:
             logger.warning(
@@ -85,10 +85,17 @@ class ParseGenderAgeHandler(Handler):
             ctx.df = df
             return ctx
 
-        raw = df[_GENDER_AGE_COL].astype(object)
-
-        df["gender"] = raw.map(_parse_gender)
-        df["age"] = raw.map(_parse_age)
+        # Один проход по строкам: `safe_lower` считается один раз на значение
+        # и переиспользуется для обоих признаков.
+        genders: list[str] = []
+        ages: list[float] = []
+        for val in df[_GENDER_AGE_COL].astype(object):
+            t = safe_lower(val)
+            genders.append(_parse_gender(t))
+            ages.append(_parse_age(t))
+
+        df["gender"] = genders
+        df["age"] = ages
 
         ctx.df = df
         return ctx
@@ -2,12 +2,12 @@
 
 import logging
 import re
-from typing import Optional
 
 import numpy as np
+import pandas as pd
 
 from ..context import PipelineContext
-from ..utils.text import safe_lower
+from ..utils.text import normalize_spaces_series
 from .base import Handler
 
 logger = logging.getLogger(__name__)
@@ -25,32 +25,10 @@ _LEVEL_MAP = {
     "Среднее": ["среднее", "secondary"],
 }
 
-
-def _parse_level(val: object) -> str:
-    """Определить укрупнённый уровень образования."""
-    t = safe_lower(val)
-    if not t:
-        return _UNKNOWN
-
-    for level, keywords in _LEVEL_MAP.items():
-        if any(k in t for k in keywords):
-            return level
-
-    return _UNKNOWN
-
-
-def _parse_year(val: object) -> float:
-    """Извлечь год окончания."""
-    t = safe_lower(val)
-    if not t:
-        return np.nan
-    m = _YEAR_RE.search(t)
-    if not m:
-        return np.nan
-    year = int(m.group(1))
-    if 1950 <= year <= 2035:
-        return float(year)
-    return np.nan
+_LEVEL_PATTERNS = {
+    level: "|".join(re.escape(k) for k in keywords)
+    for level, keywords in _LEVEL_MAP.items()
+}
 
 
 class ParseEducationHandler(Handler):
@@ -78,7 +56,7 @@ class ParseEducationHandler(Handler):
         """
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         if _EDU_COL not in df.columns:
             logger.warning("Column '%s' not found; using defaults.", _EDU_COL)
@@ -87,8 +65,22 @@ class ParseEducationHandler(Handler):
             ctx.df = df
             return ctx
 
-        df["education_level"] = df[_EDU_COL].map(_parse_level)
-        df["education_year"] = df[_EDU_COL].map(_parse_year)
+        s = normalize_spaces_series(df[_EDU_COL]).str.lower()
+
+        # Порядок условий задаёт приоритет уровней: np.select берёт первое
+        # совпадение, как и последовательная проверка по `_LEVEL_MAP`.
+        conditions = [
+            s.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+            for pattern in _LEVEL_PATTERNS.values()
+        ]
+        df["education_level"] = np.select(
+            conditions, list(_LEVEL_PATTERNS), default=_UNKNOWN
+        )
+
+        year = pd.to_numeric(
+            s.str.extract(_YEAR_RE, expand=False), errors="coerce"
+        ).astype(float)
+        df["education_year"] = year.where(year.between(1950, 2035))
 
         ctx.df = df
         return ctx
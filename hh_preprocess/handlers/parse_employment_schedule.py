@@ -112,7 +112,7 @@ class ParseEmploymentScheduleHandler(Handler):
         """
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         for col in _EMP_CANON.values():
             df[col] = 0
@@ -75,7 +75,7 @@ class ParseExperienceHandler(Handler):
         """
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         if _EXP_COL not in df.columns:
             # try to find a close match
@@ -1,9 +1,12 @@
 """Обработчик извлечения города проживания и признаков готовности к релокации."""
 
 import logging
+import re
+
+import numpy as np
 
 from ..context import PipelineContext
-from ..utils.text import normalize_spaces, safe_lower
+from ..utils.text import normalize_spaces_series
 from .base import Handler
 
 logger = logging.getLogger(__name__)
@@ -12,25 +15,21 @@ _CITY_COL = "Город"
 _UNKNOWN = "Не указано"
 
 
-def _parse_city(s: object) -> str:
-    """Извлечь город проживания."""
-    if not isinstance(s, str):
-        return _UNKNOWN
-    t = normalize_spaces(s)
-    if not t:
-        return _UNKNOWN
-    return normalize_spaces(t.split(",")[0])
+def _keywords_re(keys: list[str]) -> str:
+    """Собрать регулярное выражение-альтернацию из ключевых фраз."""
+    return "|".join(re.escape(k) for k in keys)
 
 
-def _check_keywords(text: str, yes_keys: list[str], no_keys: list[str]) -> bool:
-    """Универсальная проверка на вхождение ключевых фраз."""
-    if not text:
-        return False
-    if any(k in text for k in no_keys):
-        return False
-    if any(k in text for k in yes_keys):
-        return True
-    return False
+_RELOCATE_YES_RE = _keywords_re(
+    ["готов к переезду", "ready to relocate", "willing to relocate"]
+)
+_RELOCATE_NO_RE = _keywords_re(["не готов к переезду", "not ready", "not willing"])
+_TRIPS_YES_RE = _keywords_re(
+    ["готов к командировкам", "ready for business trips", "willing to travel"]
+)
+_TRIPS_NO_RE = _keywords_re(
+    ["не готов к командировкам", "not ready for business trips"]
+)
 
 
 class ParseLocationHandler(Handler):
@@ -61,7 +60,7 @@ class ParseLocationHandler(Handler):
         """
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         if _CITY_COL not in df.columns:
             logger.warning("Column '%s' not found; creating defaults.", _CITY_COL)
@@ -71,33 +70,19 @@ class ParseLocationHandler(Handler):
             ctx.df = df
             return ctx
 
-        norm_col = df[_CITY_COL].map(safe_lower)
-
-        df["city"] = df[_CITY_COL].map(_parse_city)
-
-        df["relocate_ready"] = norm_col.apply(
-            lambda t: _check_keywords(
-                t,
-                yes_keys=[
-                    "готов к переезду",
-                    "ready to relocate",
-                    "willing to relocate",
-                ],
-                no_keys=["не готов к переезду", "not ready", "not willing"],
-            )
-        ).astype(bool)
-
-        df["trips_ready"] = norm_col.apply(
-            lambda t: _check_keywords(
-                t,
-                yes_keys=[
-                    "готов к командировкам",
-                    "ready for business trips",
-                    "willing to travel",
-                ],
-                no_keys=["не готов к командировкам", "not ready for business trips"],
-            )
-        ).astype(bool)
+        norm = normalize_spaces_series(df[_CITY_COL])
+        low = norm.str.lower()
+
+        # Отрезаем всё после первой запятой одним regex-проходом: в отличие от
+        # `str.split(...).str[0]`, колонка остаётся `string[pyarrow]`.
+        city = norm.str.replace(r"(?s),.*", "", regex=True).str.strip()
+        df["city"] = city.where(norm.ne(""), _UNKNOWN)
+
+        def has_any(pattern: str) -> np.ndarray:
+            return low.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+
+        df["relocate_ready"] = has_any(_RELOCATE_YES_RE) & ~has_any(_RELOCATE_NO_RE)
+        df["trips_ready"] = has_any(_TRIPS_YES_RE) & ~has_any(_TRIPS_NO_RE)
 
         ctx.df = df
         return ctx
@@ -2,19 +2,21 @@
 
 import logging
 import re
-from typing import Optional
 
 import numpy as np
+import pandas as pd
 
 from ..context import PipelineContext
 from ..utils.currency import load_fx_rates
-from ..utils.text import normalize_spaces, safe_lower
+from ..utils.text import normalize_spaces_series
 from .base import Handler
 
 logger = logging.getLogger(__name__)
 
 _SALARY_COL = "ЗП"
-_NUM_RE = re.compile(r"(\d[\d\s]*)")
+# Первое число и (если есть) следующее за ним — границы вилки «от ... до ...».
+# Только ASCII-цифры: после удаления пробелов группа всегда приводится к float.
+_NUM_RE = re.compile(r"([0-9][0-9 ]*)(?:[^0-9]+([0-9][0-9 ]*))?")
 
 _CURRENCY_MAP = {
     "руб": "RUB",
@@ -41,80 +43,58 @@ _CURRENCY_MAP = {
     "манат": "AZN",
 }
 
+_CURRENCY_PATTERNS = {
+    code: "|".join(re.escape(k) for k, c in _CURRENCY_MAP.items() if c == code)
+    for code in dict.fromkeys(_CURRENCY_MAP.values())
+}
+# Категории `salary_currency`; код 0 (пустая строка) — валюта не определялась.
+_CUR_TABLE = ["", *sorted(_CURRENCY_PATTERNS)]
+_STOP_RE = "договор|negotiable"
+
 
-def _detect_currency(s: str) -> Optional[str]:
-    """Определить валюту по текстовому представлению зарплаты.
+def _detect_currency(low: pd.Series) -> np.ndarray:
+    """Определить валюту для каждой строки колонки зарплаты.
 
-    По строке ищутся характерные маркеры валюты (например, `руб`, `usd`, `€`).
-    Если валюта не распознана, возвращается `None`.
+    Для каждой валюты из `_CURRENCY_MAP` строится одна альтернация маркеров
+    (например, `руб|rur|rub|₽`). Валюты проверяются в порядке `_CURRENCY_MAP`:
+    побеждает первая найденная. Если валюта не распознана, используется `RUB`.
 
     Аргументы:
-        s: Текстовое значение зарплаты.
+        low: Текст зарплаты в нижнем регистре.
 
     Возвращает:
-        Код валюты (например, `RUB`, `USD`, `EUR`) или `None`, если определить не удалось.
+        Массив `int8` с индексами валют в `_CUR_TABLE`.
     """
-    t = s.lower()
-    for key, code in _CURRENCY_MAP.items():
-        if key in t:
-            return code
-    return None
+    conditions = [
+        low.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+        for pattern in _CURRENCY_PATTERNS.values()
+    ]
+    choices = [_CUR_TABLE.index(code) for code in _CURRENCY_PATTERNS]
+    codes = np.select(conditions, choices, default=_CUR_TABLE.index("RUB"))
+    return codes.astype(np.int8)
 
 
-def _extract_numbers(s: str) -> list[int]:
-    """Извлечь целые числа из строки.
+def _extract_numbers(norm: pd.Series) -> pd.DataFrame:
+    """Извлечь первые два целых числа из каждой строки колонки.
 
-    По регулярному выражению находятся группы цифр (в том числе с пробелами и
-    неразрывными пробелами), после чего они нормализуются и преобразуются в `int`.
+    Группы цифр могут быть разделены пробелами (`100 000`); пробелы удаляются
+    перед преобразованием в число.
 
     Аргументы:
-        s: Текст, в котором нужно найти числа.
+        norm: Текст зарплаты с нормализованными пробелами.
 
     Возвращает:
-        Список найденных чисел в порядке появления в строке.
+        DataFrame из двух float-колонок (первое и второе число); `NaN`,
+        если соответствующее число не найдено.
     """
-    nums: list[int] = []
-    for m in _NUM_RE.finditer(s):
-        raw = m.group(1).replace("\u00a0", " ").replace(" ", "")
-        if raw.isdigit():
-            nums.append(int(raw))
+    nums = norm.str.extract(_NUM_RE)
+    # Приводим каждую колонку явно: `DataFrame.apply` не вызывает функцию
+    # на пустом DataFrame, и колонки остались бы строковыми.
+    for col in nums.columns:
+        nums[col] = nums[col].str.replace(" ", "", regex=False).astype("float64")
     return nums
 
 
-def _calculate_rub_salary(val: object, rates: dict) -> tuple[float, str]:
-    """Вычислить зарплату в рублях для одной строки."""
-    if not isinstance(val, str):
-        return np.nan, ""
-
-    s = normalize_spaces(val)
-    if not s:
-        return np.nan, ""
-
-    t = safe_lower(s)
-    if any(stop in t for stop in ["договор", "negotiable"]):
-        return np.nan, ""
-
-    cur = _detect_currency(s) or "RUB"
-    nums = _extract_numbers(s)
-
-    if not nums:
-        return np.nan, cur
-
-    amount = float(nums[0])
-    if len(nums) >= 2:
-        amount = (nums[0] + nums[1]) / 2.0
-
-    if "тыс" in t or "k" in t:
-        amount *= 1000.0
-
-    rate = rates.get(cur)
-    if rate is None:
-        return np.nan, cur
-
-    rub = amount * float(rate)
-    return (rub, cur) if rub > 0 else (np.nan, cur)
-
-
 class ParseSalaryHandler(Handler):
     """Преобразовать зарплату в рублях в колонку `target_salary_rub`."""
 
@@ -135,17 +115,46 @@ class ParseSalaryHandler(Handler):
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
 
-        df = ctx.df.copy()
+        df = ctx.df
         if _SALARY_COL not in df.columns:
             raise ValueError(f"Required target column '{_SALARY_COL}' not found")
 
         fx = load_fx_rates(ctx.output_dir)
         ctx.diag["fx_rates_source"] = fx.source
 
-        results = df[_SALARY_COL].apply(lambda x: _calculate_rub_salary(x, fx.rates))
-
-        df["target_salary_rub"] = [r[0] for r in results]
-        df["salary_currency"] = [r[1] for r in results]
+        norm = normalize_spaces_series(df[_SALARY_COL])
+        low = norm.str.lower()
+        skip = (low.eq("") | low.str.contains(_STOP_RE, regex=True)).to_numpy(
+            dtype=bool
+        )
+
+        # Пустые и «договорные» зарплаты дают NaN, поэтому дальнейший
+        # разбор выполняется только для оставшихся строк.
+        valid = np.flatnonzero(~skip)
+        norm = norm.iloc[valid]
+        low = low.iloc[valid]
+
+        cur_codes = np.zeros(len(df), dtype=np.int8)
+        cur_codes[valid] = _detect_currency(low)
+
+        nums = _extract_numbers(norm)
+        n1 = nums[0].to_numpy()
+        n2 = nums[1].to_numpy()
+        amount = np.where(np.isnan(n2), n1, (n1 + n2) / 2.0)
+        thousands = low.str.contains("тыс|k", regex=True).to_numpy(dtype=bool)
+        amount = np.where(thousands, amount * 1000.0, amount)
+
+        fx_map = pd.Series({code: float(r) for code, r in fx.rates.items()})
+        rate = fx_map.reindex(_CUR_TABLE).to_numpy(dtype=float)[cur_codes[valid]]
+        rub_valid = amount * rate
+        rub_valid[~(rub_valid > 0)] = np.nan
+        rub = np.full(len(df), np.nan, dtype=np.float32)
+        rub[valid] = rub_valid
+
+        df["target_salary_rub"] = rub
+        df["salary_currency"] = pd.Categorical.from_codes(
+            cur_codes, categories=_CUR_TABLE
+        )
 
         target = df["target_salary_rub"]
         nan_mask = target.isna()
@@ -31,7 +31,7 @@ class ParseResumeUpdateHandler(Handler):
         """
         if ctx.df is None:
             raise ValueError("DataFrame is not loaded")
-        df = ctx.df.copy()
+        df = ctx.df
 
         if _UPDATE_COL not in df.columns:
             logger.warning("Column '%s' not found; using zeros.", _UPDATE_COL)
@@ -3,14 +3,48 @@
 import re
 from typing import Iterable
 
-_SPACE_RE = re.compile(r"\s+")
+import pandas as pd
+
+# Те же символы, что `str.isspace()` (и `\s` в `re`), но явным классом:
+# в `string[pyarrow]` регулярки исполняет RE2, где `\s` — только ASCII.
+_SERIES_SPACE_RE = (
+    "[\t-\r\x1c- \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+"
+)
 _SPB_ALIAS = "санкт-петербург"
 _MSK_ALIAS = "москва"
 
 
 def normalize_spaces(s: str) -> str:
-    """Удалить лишние пробелы и неразрывные пробелы."""
-    return _SPACE_RE.sub(" ", s.replace("\xa0", " ")).strip()
+    """Удалить лишние пробелы и неразрывные пробелы.
+
+    `str.split()` без аргументов режет по тем же Unicode-пробелам, что и `\\s`
+    в `re` (включая `\\xa0`), и сразу отбрасывает пробелы по краям.
+    """
+    return " ".join(s.split())
+
+
+def normalize_spaces_series(s: pd.Series) -> pd.Series:
+    """Векторный аналог `normalize_spaces` для колонки DataFrame.
+
+    Как и `safe_lower`, учитываются только значения типа `str`: пропуски и
+    любые нестроковые значения (числа и т.п.) заменяются пустой строкой.
+    Колонка приводится к `string[pyarrow]`, пробельные последовательности
+    схлопываются одним проходом регулярного выражения.
+
+    Аргументы:
+        s: Исходная колонка с текстом.
+
+    Возвращает:
+        Колонка `string[pyarrow]` с нормализованными пробелами.
+    """
+    if not isinstance(s.dtype, pd.StringDtype):
+        s = s.where(s.map(type).eq(str))
+    return (
+        s.astype("string[pyarrow]")
+        .str.replace(_SERIES_SPACE_RE, " ", regex=True)
+        .str.strip()
+        .fillna("")
+    )
 
 
 def safe_lower(s: object) -> str:
@@ -27,7 +61,9 @@ def split_multi_categories(text: object) -> list[str]:
     s = normalize_spaces(text)
     if not s:
         return []
-    parts = re.split(r"[,;/]", s)
+    # Приводим разделители к запятой: два str.replace быстрее re.split
+    # и str.translate для такого маленького набора символов.
+    parts = s.replace(";", ",").replace("/", ",").split(",")
     out: list[str] = []
     for p in parts:
         p = normalize_spaces(p).lower()